@@ -0,0 +1,134 @@
+# Copyright 2019, David Wilson
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+# this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+# may be used to endorse or promote products derived from this software without
+# specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+# !mitogen: minify_safe
+
+"""
+Thin wrapper around whichever JSON decoder is fastest on the running
+interpreter. :mod:`orjson` is preferred, then :mod:`ujson`, then the standard
+library :mod:`json`.
+
+The accelerated decoders are stricter than :mod:`json` (e.g. orjson refuses
+the ``NaN`` and ``Infinity`` tokens :func:`json.dumps` emits by default, and
+reads integers wider than 64 bits as floats), so :func:`loads` falls back to
+the standard library for any document they reject or may misread, rather than
+changing what Ansible sees.
+
+Encoding always uses :mod:`json`: the accelerated encoders silently write
+non-finite floats as ``null`` and accept types :mod:`json` refuses, and
+detecting either costs more than the encoder saves.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import codecs
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+__all__ = [
+    'dumpb',
+    'dumps',
+    'loads',
+]
+
+# Match Ansible's to_bytes(errors='surrogate_or_strict'), so strings carrying
+# undecodable bytes (e.g. from a filename) survive encoding.
+try:
+    codecs.lookup_error('surrogateescape')
+    _ENCODE_ERRORS = 'surrogateescape'
+except LookupError:
+    _ENCODE_ERRORS = 'strict'
+
+# Any run this long may be an integer outside the 64-bit range the accelerated
+# decoders read exactly. Matches inside strings merely cost the fast path.
+_LONG_DIGITS_RE = re.compile(u'[0-9]{19}')
+_LONG_DIGITS_BYTES_RE = re.compile(b'[0-9]{19}')
+
+
+def dumps(obj, ensure_ascii=True):
+    """
+    Serialize `obj` to a JSON formatted :class:`str`, escaping non-ASCII
+    characters unless `ensure_ascii` is :data:`False`, as :func:`json.dumps`.
+    """
+    if ensure_ascii:
+        return json.dumps(obj)
+    try:
+        return json.dumps(obj, ensure_ascii=False)
+    except UnicodeDecodeError:
+        # Python 2: a bytes value containing non-ASCII.
+        return json.dumps(obj)
+
+
+def dumpb(obj, ensure_ascii=True):
+    """
+    Serialize `obj` to UTF-8 encoded JSON :class:`bytes`. See :func:`dumps`.
+    """
+    s = dumps(obj, ensure_ascii=ensure_ascii)
+    if not isinstance(s, bytes):
+        s = s.encode('utf-8', _ENCODE_ERRORS)
+    return s
+
+
+def _has_long_digits(s):
+    if isinstance(s, bytes):
+        return _LONG_DIGITS_BYTES_RE.search(s) is not None
+    return _LONG_DIGITS_RE.search(s) is not None
+
+
+if orjson is not None:
+    _fast_loads = orjson.loads
+elif ujson is not None:
+    _fast_loads = ujson.loads
+else:
+    _fast_loads = None
+
+
+def loads(s):
+    """
+    Deserialize the JSON document `s`, which may be :class:`str` or
+    :class:`bytes`.
+    """
+    if _fast_loads is not None and not _has_long_digits(s):
+        try:
+            return _fast_loads(s)
+        except ValueError:
+            pass
+    if isinstance(s, bytes):
+        s = s.decode('utf-8')
+    return json.loads(s)
@@ -531,6 +531,11 @@ class Connection(ansible.plugins.connection.ConnectionBase):
     # set by `_get_task_vars()` for interpreter discovery
     _action = None
 
+    #: Results of :func:`os.path.expanduser` in the target, keyed by `(path,
+    #: use_login)`. Reset with the rest of the per-context state by
+    #: :meth:`_put_connection`.
+    _expanduser_cache = None
+
     def on_action_run(self, task_vars, delegate_to_hostname, loader_basedir):
         """
         Invoked by ActionModuleMixin to indicate a new task is about to start
@@ -855,10 +860,14 @@ class Connection(ansible.plugins.connection.ConnectionBase):
             return
 
         inventory_name, stack = self._build_stack()
-        worker_model = ansible_mitogen.process.get_worker_model()
-        self.binding = worker_model.get_binding(
-            ansible_mitogen.utils.unsafe.cast(inventory_name)
-        )
+        # on_action_run() drops the context but keeps the binding, so a loop
+        # item reconnecting reuses it unless another connection has since
+        # superseded it.
+        if self.binding is None or self.binding.closed:
+            worker_model = ansible_mitogen.process.get_worker_model()
+            self.binding = worker_model.get_binding(
+                ansible_mitogen.utils.unsafe.cast(inventory_name)
+            )
         self._connect_stack(stack)
 
     def _put_connection(self):
@@ -882,6 +891,7 @@ class Connection(ansible.plugins.connection.ConnectionBase):
         self.login_context = None
         self.init_child_result = None
         self.chain = None
+        self._expanduser_cache = None
 
     def close(self):
         """
@@ -1030,6 +1040,32 @@ class Connection(ansible.plugins.connection.ConnectionBase):
             ansible_mitogen.target.spawn_isolated_child
         )
 
+    def expanduser(self, path, use_login=False):
+        """
+        Return the result of :func:`os.path.expanduser` for `path` in the
+        target, remembering it for as long as the context is in use.
+
+        :param bool use_login:
+            If :data:`True`, expand `path` in the login account rather than
+            any active become user.
+        """
+        self._connect()
+        if self._expanduser_cache is None:
+            self._expanduser_cache = {}
+
+        key = (path, use_login)
+        try:
+            return self._expanduser_cache[key]
+        except KeyError:
+            pass
+
+        result = self.get_chain(use_login=use_login).call(
+            os.path.expanduser,
+            ansible_mitogen.utils.unsafe.cast(path),
+        )
+        self._expanduser_cache[key] = result
+        return result
+
     def get_extra_args(self):
         """
         Overridden by connections/mitogen_kubectl.py to a list of additional
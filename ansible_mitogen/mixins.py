@@ -29,10 +29,8 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-import json
 import logging
 import os
-import pwd
 import random
 import traceback
 
@@ -45,8 +43,8 @@ from ansible.module_utils.common.text.converters import to_bytes, to_text
 from ansible.module_utils.six.moves import shlex_quote
 
 import mitogen.core
-import mitogen.select
 
+import ansible_mitogen._json
 import ansible_mitogen.connection
 import ansible_mitogen.planner
 import ansible_mitogen.target
@@ -120,12 +118,19 @@ class ActionModuleMixin(ansible.plugins.action.ActionBase):
         )
         return super(ActionModuleMixin, self).run(tmp, task_vars)
 
-    COMMAND_RESULT = {
-        'rc': 0,
-        'stdout': '',
-        'stdout_lines': [],
-        'stderr': ''
-    }
+    @staticmethod
+    def _command_result():
+        """
+        Return a new successful result in the style of
+        _low_level_execute_command(). A fresh dict is built each time, so
+        callers never share the mutable `stdout_lines` list.
+        """
+        return {
+            'rc': 0,
+            'stdout': '',
+            'stdout_lines': [],
+            'stderr': ''
+        }
 
     def fake_shell(self, func, stdout=False):
         """
@@ -140,9 +145,9 @@ class ActionModuleMixin(ansible.plugins.action.ActionBase):
         :param func:
             Function invoked as `func()`.
         :returns:
-            See :py:attr:`COMMAND_RESULT`.
+            See :py:meth:`_command_result`.
         """
-        dct = self.COMMAND_RESULT.copy()
+        dct = self._command_result()
         try:
             rc = func()
             if stdout:
@@ -222,11 +227,8 @@ class ActionModuleMixin(ansible.plugins.action.ActionBase):
         if data is None and ansible_mitogen.utils.ansible_version[:2] <= (2, 18):
             data = '{}'
         if isinstance(data, dict):
-            try:
-                data = json.dumps(data, ensure_ascii=False)
-            except UnicodeDecodeError:
-                data = json.dumps(data)
-        if not isinstance(data, bytes):
+            data = ansible_mitogen._json.dumpb(data, ensure_ascii=False)
+        elif not isinstance(data, bytes):
             data = to_bytes(data, errors='surrogate_or_strict')
 
         LOG.debug('_transfer_data(%r, %s ..%d bytes)',
@@ -249,37 +251,32 @@ class ActionModuleMixin(ansible.plugins.action.ActionBase):
                   remote_paths, remote_user, execute)
         if execute and self._task.action not in self.FIXUP_PERMS_RED_HERRING:
             return self._remote_chmod(remote_paths, mode='u+x')
-        return self.COMMAND_RESULT.copy()
+        return self._command_result()
 
     def _remote_chmod(self, paths, mode, sudoable=False):
         """
-        Issue an asynchronous set_file_mode() call for every path in `paths`,
-        then format the resulting return value list with fake_shell().
+        Issue a single set_file_modes() call covering every path in `paths`,
+        then format the result with fake_shell().
         """
         LOG.debug('_remote_chmod(%r, mode=%r, sudoable=%r)',
                   paths, mode, sudoable)
-        return self.fake_shell(lambda: mitogen.select.Select.all(
-            self._connection.get_chain().call_async(
-                ansible_mitogen.target.set_file_mode,
-                ansible_mitogen.utils.unsafe.cast(path),
-                mode,
-            )
-            for path in paths
+        return self.fake_shell(lambda: self._connection.get_chain().call(
+            ansible_mitogen.target.set_file_modes,
+            [ansible_mitogen.utils.unsafe.cast(path) for path in paths],
+            mode,
         ))
 
     def _remote_chown(self, paths, user, sudoable=False):
         """
-        Issue an asynchronous os.chown() call for every path in `paths`, then
-        format the resulting return value list with fake_shell().
+        Issue a single set_file_owners() call covering every path in `paths`,
+        then format the result with fake_shell().
         """
         LOG.debug('_remote_chown(%r, user=%r, sudoable=%r)',
                   paths, user, sudoable)
-        ent = self._connection.get_chain().call(pwd.getpwnam, user)
-        return self.fake_shell(lambda: mitogen.select.Select.all(
-            self._connection.get_chain().call_async(
-                os.chown, path, ent.pw_uid, ent.pw_gid
-            )
-            for path in paths
+        return self.fake_shell(lambda: self._connection.get_chain().call(
+            ansible_mitogen.target.set_file_owners,
+            [ansible_mitogen.utils.unsafe.cast(path) for path in paths],
+            ansible_mitogen.utils.unsafe.cast(user),
         ))
 
     def _remote_expand_user(self, path, sudoable=True):
@@ -304,10 +301,7 @@ class ActionModuleMixin(ansible.plugins.action.ActionBase):
                 # ~/.ansible -> /home/dmw/.ansible
                 return os.path.join(self._connection.homedir, path[2:])
         # ~root/.ansible -> /root/.ansible
-        return self._connection.get_chain(use_login=(not sudoable)).call(
-            os.path.expanduser,
-            ansible_mitogen.utils.unsafe.cast(path),
-        )
+        return self._connection.expanduser(path, use_login=(not sudoable))
 
     def get_task_timeout_secs(self):
         """
@@ -492,13 +486,26 @@ class ActionModuleMixin(ansible.plugins.action.ActionBase):
                     )
                     continue
 
-        stdout_text = to_text(stdout, errors=encoding_errors)
-        stderr_text = to_text(stderr, errors=encoding_errors)
+        # Most commands produce little or no output, especially on stderr, so
+        # skip decoding and splitting entirely when there is none.
+        # stdout_lines is built eagerly: results are pickled to the strategy
+        # process and JSON encoded by callbacks, both of which read a list's
+        # storage directly and would bypass any lazy list subclass.
+        if stdout:
+            stdout_text = to_text(stdout, errors=encoding_errors)
+            stdout_lines = stdout_text.splitlines()
+        else:
+            stdout_text, stdout_lines = u'', []
+        if stderr:
+            stderr_text = to_text(stderr, errors=encoding_errors)
+            stderr_lines = stderr_text.splitlines()
+        else:
+            stderr_text, stderr_lines = u'', []
 
         return {
             'rc': rc,
             'stdout': stdout_text,
-            'stdout_lines': stdout_text.splitlines(),
+            'stdout_lines': stdout_lines,
             'stderr': stderr_text,
-            'stderr_lines': stderr_text.splitlines(),
+            'stderr_lines': stderr_lines,
         }
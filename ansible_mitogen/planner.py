@@ -38,7 +38,6 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __metaclass__ = type
 
-import json
 import logging
 import os
 import random
@@ -52,6 +51,7 @@ import mitogen.core
 import mitogen.select
 import mitogen.service
 
+import ansible_mitogen._json
 import ansible_mitogen.loaders
 import ansible_mitogen.parsing
 import ansible_mitogen.target
@@ -205,7 +205,7 @@ class BinaryPlanner(Planner):
             runner_name=self.runner_name,
             module=self._inv.module_name,
             path=self._inv.module_path,
-            json_args=json.dumps(self._inv.module_args),
+            json_args=ansible_mitogen._json.dumps(self._inv.module_args),
             env=ansible_mitogen.utils.unsafe.cast(self._inv.env),
             **kwargs
         )
@@ -581,7 +581,7 @@ def _invoke_async_task(invocation, planner):
             break
 
         return {
-            'stdout': json.dumps({
+            'stdout': ansible_mitogen._json.dumps({
                 # modules/utilities/logic/async_wrapper.py::_run_module().
                 'changed': True,
                 'started': 1,
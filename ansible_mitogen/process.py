@@ -294,6 +294,10 @@ class Binding(object):
     varies according to the target machine. Depending on the particular
     implementation, this class represents a binding to the correct MuxProcess.
     """
+    #: :data:`True` once :meth:`close` has been called, or the worker model
+    #: has handed a newer binding to another connection.
+    closed = False
+
     def get_child_service_context(self):
         """
         Return the :class:`mitogen.core.Context` to which children should
@@ -376,9 +380,11 @@ class ClassicBinding(Binding):
 
     def close(self):
         """
-        See Binding.close().
+        See Binding.close(). Safe to call multiple times.
         """
-        self.model.on_binding_close()
+        if not self.closed:
+            self.closed = True
+            self.model.on_binding_close(self)
 
 
 class ClassicWorkerModel(WorkerModel):
@@ -403,6 +409,13 @@ class ClassicWorkerModel(WorkerModel):
     #: Name of multiplexer process socket we are currently connected to.
     listener_path = None
 
+    #: The :class:`ClassicBinding` most recently returned by
+    #: :meth:`get_binding`. Ansible may replace a connection without closing
+    #: it, e.g. when remote_addr changes between loop items, so each new
+    #: binding supersedes the last rather than being counted. :attr:`broker`
+    #: is torn down when this binding is closed.
+    binding = None
+
     #: mitogen.parent.Context representing the parent Context, which is the
     #: connection multiplexer process when running in classic mode, or the
     #: top-level process when running a new-style mode.
@@ -509,7 +522,7 @@ class ClassicWorkerModel(WorkerModel):
         """
         Used to clean up in unit tests.
         """
-        self.on_binding_close()
+        self._shutdown_broker()
         self._on_process_exit()
         set_worker_model(None)
 
@@ -537,9 +550,25 @@ class ClassicWorkerModel(WorkerModel):
         if path != self.listener_path:
             self._reconnect(path)
 
-        return ClassicBinding(self)
+        self._release_binding()
+        self.binding = ClassicBinding(self)
+        return self.binding
+
+    def on_binding_close(self, binding):
+        """
+        Called by :meth:`ClassicBinding.close`. Shut down the broker if
+        `binding` is current; a superseded binding no longer owns it.
+        """
+        if binding is self.binding:
+            self._shutdown_broker()
+
+    def _release_binding(self):
+        if self.binding is not None:
+            self.binding.closed = True
+            self.binding = None
 
-    def on_binding_close(self):
+    def _shutdown_broker(self):
+        self._release_binding()
         if not self.broker:
             return
 
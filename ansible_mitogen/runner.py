@@ -60,6 +60,7 @@ else:
 from ansible.module_utils.six.moves import shlex_quote
 
 import mitogen.core
+import ansible_mitogen._json
 import ansible_mitogen.target  # TODO: circular import
 from mitogen.core import to_text
 
@@ -257,6 +258,17 @@ _pam_env_watcher = EnvironmentFileWatcher('~/.pam_environment')
 _etc_env_watcher = EnvironmentFileWatcher('/etc/environment')
 
 
+def is_ascii(s):
+    """
+    Return :data:`True` if the text `s` contains only ASCII characters.
+    """
+    try:
+        s.encode('ascii')
+    except UnicodeError:
+        return False
+    return True
+
+
 def utf8(s):
     """
     Coerce an object to bytes if it is Unicode.
@@ -324,7 +336,16 @@ class Runner(object):
         self.service_context = service_context
         self.econtext = econtext
         self.detach = detach
-        self.args = json.loads(mitogen.core.to_text(json_args))
+        json_args = mitogen.core.to_text(json_args)
+        self.args = ansible_mitogen._json.loads(json_args)
+        if not is_ascii(json_args):
+            # Runners write this to the module strictly encoded, so it must be
+            # escaped like json.dumps() output, e.g. for surrogate-escaped
+            # filenames.
+            json_args = ansible_mitogen._json.dumps(self.args)
+        #: The module arguments as ASCII JSON, reused by runners that pass them
+        #: to the module as JSON rather than encoding :attr:`args` again.
+        self.json_args = json_args
         self.good_temp_dir = good_temp_dir
         self.extra_env = extra_env
         self.env = env
@@ -595,20 +616,28 @@ class TemporaryEnvironment(object):
         self.env = env or {}
         for key, value in mitogen.core.iteritems(self.env):
             key = mitogen.core.to_text(key)
-            value = mitogen.core.to_text(value)
             if value is None:
                 os.environ.pop(key, None)
             else:
-                os.environ[key] = str(value)
+                os.environ[key] = str(mitogen.core.to_text(value))
 
     def revert(self):
         """
         Revert changes made by the module to the process environment. This must
         always run, as some modules (e.g. git.py) set variables like GIT_SSH
         that must be cleared out between runs.
+
+        Only keys that differ from the snapshot are written, as every write to
+        :data:`os.environ` also calls :func:`os.putenv` or :func:`os.unsetenv`,
+        and usually a module run changes few if any variables.
         """
-        os.environ.clear()
-        os.environ.update(self.original)
+        environ = os.environ
+        original = self.original
+        for key in [key for key in environ if key not in original]:
+            del environ[key]
+        for key, value in mitogen.core.iteritems(original):
+            if environ.get(key) != value:
+                environ[key] = value
 
 
 class TemporaryArgv(object):
@@ -623,15 +652,18 @@ class TemporaryArgv(object):
 class NewStyleStdio(object):
     """
     Patch ansible.module_utils.basic argument globals.
+
+    :param str json_args:
+        Module arguments, already encoded as a JSON object.
     """
-    def __init__(self, args, temp_dir):
+    def __init__(self, json_args, temp_dir):
         self.temp_dir = temp_dir
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
         self.original_stdin = sys.stdin
         sys.stdout = StringIO()
         sys.stderr = StringIO()
-        encoded = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+        encoded = u'{"ANSIBLE_MODULE_ARGS": %s}' % (json_args,)
         ansible.module_utils.basic._ANSIBLE_ARGS = utf8(encoded)
         ansible.module_utils.basic._ANSIBLE_PROFILE = 'legacy'
         sys.stdin = StringIO(mitogen.core.to_text(encoded))
@@ -781,7 +813,7 @@ class ArgsFileRunner(Runner):
         """
         Return the module arguments formatted as JSON.
         """
-        return json.dumps(self.args)
+        return self.json_args
 
     def _get_program_args(self):
         return [self.args_fp.name]
@@ -916,7 +948,7 @@ class NewStyleRunner(ScriptRunner):
     def setup(self):
         super(NewStyleRunner, self).setup()
 
-        self._stdio = NewStyleStdio(self.args, self.get_temp_dir())
+        self._stdio = NewStyleStdio(self.json_args, self.get_temp_dir())
         # It is possible that not supplying the script filename will break some
         # module, but this has never been a bug report. Instead act like an
         # interpreter that had its script piped on stdin.
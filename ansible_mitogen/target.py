@@ -38,7 +38,6 @@ __metaclass__ = type
 
 import errno
 import grp
-import json
 import logging
 import os
 import pty
@@ -65,6 +64,7 @@ if not sys.modules.get(str('__main__')):
 
 import ansible.module_utils.json_utils
 
+import ansible_mitogen._json
 import ansible_mitogen.runner
 
 
@@ -432,7 +432,7 @@ class AsyncRunner(object):
 
         fp = open(self.path + '.tmp', 'w')
         try:
-            fp.write(json.dumps(dct))
+            fp.write(ansible_mitogen._json.dumps(dct))
         finally:
             fp.close()
         os.rename(self.path + '.tmp', self.path)
@@ -470,7 +470,7 @@ class AsyncRunner(object):
             ansible.module_utils.json_utils.
             _filter_non_json_lines(dct['stdout'])
         )
-        result = json.loads(filtered)
+        result = ansible_mitogen._json.loads(filtered)
         result.setdefault('warnings', []).extend(warnings)
         result['stderr'] = dct['stderr'] or result.get('stderr', '')
         self._update(result)
@@ -604,11 +604,64 @@ def exec_args(args, in_data='', chdir=None, shell=None, emulate_tty=False):
     return proc.returncode, stdout, stderr or b''
 
 
+#: Characters with special meaning to a POSIX shell. A command line containing
+#: none of them is simply an argument vector separated by spaces and tabs.
+SHELL_META_PAT = re.compile(u'[\n\r|&;<>()$`\\\\"\'*?[\\]#~=%!{}]')
+
+#: Field separators of the default shell IFS, excluding newline, which is
+#: already in :data:`SHELL_META_PAT`. Other whitespace, e.g. U+00A0, is part
+#: of a word to the shell and must not split arguments.
+SHELL_IFS_PAT = re.compile(u'[ \t]+')
+
+#: Reserved words and builtins that only have their meaning when interpreted
+#: by the shell, or behave differently from the program of the same name (e.g.
+#: ``echo -e``), so a command line beginning with one is never run directly.
+SHELL_WORDS = frozenset([
+    u'.', u':', u'alias', u'bg', u'bind', u'break', u'builtin', u'caller',
+    u'case', u'cd', u'command', u'compgen', u'complete', u'continue',
+    u'declare', u'dirs', u'disown', u'do', u'done', u'echo', u'elif',
+    u'else', u'enable', u'esac', u'eval', u'exec', u'exit', u'export',
+    u'false', u'fc', u'fg', u'fi', u'for', u'function', u'getopts', u'hash',
+    u'help', u'history', u'if', u'jobs', u'kill', u'let', u'local',
+    u'logout', u'mapfile', u'popd', u'printf', u'pushd', u'pwd', u'read',
+    u'readarray', u'readonly', u'return', u'select', u'set', u'shift',
+    u'shopt', u'source', u'suspend', u'test', u'then', u'time', u'times',
+    u'trap', u'true', u'type', u'typeset', u'ulimit', u'umask', u'unalias',
+    u'unset', u'until', u'wait', u'while',
+])
+
+#: Login shells whose ``-c`` runs a simple command exactly as executing it
+#: directly would, provided ``BASH_ENV`` is unset. Any other shell, e.g. a
+#: restricted shell or nologin, always receives the command line.
+DIRECT_EXEC_SHELLS = frozenset(['sh', 'bash', 'dash'])
+
+
+def split_simple_command(cmd):
+    """
+    If `cmd` is a command line that would be run identically with or without
+    a shell, return its argument vector, otherwise return :data:`None`.
+    """
+    if SHELL_META_PAT.search(cmd):
+        return None
+    cmd = cmd.strip(u' \t')
+    if not cmd:
+        return None
+    args = SHELL_IFS_PAT.split(cmd)
+    if args[0] in SHELL_WORDS:
+        return None
+    return args
+
+
 def exec_command(cmd, in_data='', chdir=None, shell=None, emulate_tty=False):
     """
     Run a command in a subprocess, emulating the argument handling behaviour of
     SSH.
 
+    Command lines without shell syntax are executed directly when the user's
+    shell is one of :data:`DIRECT_EXEC_SHELLS`, saving a fork and exec of it.
+    If that fails (e.g. the command is a shell function, or a script lacking
+    an interpreter line), the command is retried via the shell.
+
     :param bytes cmd:
         String command line, passed to user's shell.
     :param bytes in_data:
@@ -617,8 +670,27 @@ def exec_command(cmd, in_data='', chdir=None, shell=None, emulate_tty=False):
         (return code, stdout bytes, stderr bytes)
     """
     assert isinstance(cmd, mitogen.core.UnicodeType)
+    user_shell = get_user_shell()
+    args = None
+    if (os.path.basename(user_shell) in DIRECT_EXEC_SHELLS and
+            not os.environ.get('BASH_ENV')):
+        args = split_simple_command(cmd)
+    if args is not None:
+        try:
+            return exec_args(
+                args=args,
+                in_data=in_data,
+                chdir=chdir,
+                shell=shell,
+                emulate_tty=emulate_tty,
+            )
+        except OSError:
+            e = sys.exc_info()[1]
+            LOG.debug('exec_command(%r): direct execution failed, retrying '
+                      'via shell: %s', cmd, e)
+
     return exec_args(
-        args=[get_user_shell(), '-c', cmd],
+        args=[user_shell, '-c', cmd],
         in_data=in_data,
         chdir=chdir,
         shell=shell,
@@ -630,8 +702,20 @@ def read_path(path):
     """
     Fetch the contents of a filesystem `path` as bytes.
     """
-    with open(path, 'rb') as f:
-        return f.read()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Size the reads from fstat() so a regular file normally arrives in a
+        # single read(), but keep going until EOF since st_size is only a hint
+        # (e.g. files in /proc report 0).
+        size = max(os.fstat(fd).st_size, mitogen.core.CHUNK_SIZE)
+        chunks = []
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
 
 
 def set_file_owner(path, owner, group=None, fd=None):
@@ -660,21 +744,24 @@ def write_path(path, s, owner=None, group=None, mode=None,
     fd, tmp_path = tempfile.mkstemp(suffix='.tmp',
                                     prefix='.ansible_mitogen_transfer-',
                                     dir=os.path.dirname(path))
-    fp = os.fdopen(fd, 'wb', mitogen.core.CHUNK_SIZE)
     LOG.debug('write_path(path=%r) temporary file: %s', path, tmp_path)
 
     try:
         try:
             if mode:
-                set_file_mode(tmp_path, mode, fd=fp.fileno())
+                set_file_mode(tmp_path, mode, fd=fd)
             if owner or group:
-                set_file_owner(tmp_path, owner, group, fd=fp.fileno())
-            fp.write(s)
+                set_file_owner(tmp_path, owner, group, fd=fd)
+            # Write directly to the descriptor, avoiding a copy through a
+            # buffered file object. A regular file accepts it in one write().
+            written = 0
+            while written < len(s):
+                written += os.write(fd, s[written:])
+            if sync:
+                os.fsync(fd)
         finally:
-            fp.close()
+            os.close(fd)
 
-        if sync:
-            os.fsync(fp.fileno())
         os.rename(tmp_path, path)
     except BaseException:
         os.unlink(tmp_path)
@@ -684,47 +771,116 @@ def write_path(path, s, owner=None, group=None, mode=None,
         os.utime(path, utimes)
 
 
-CHMOD_CLAUSE_PAT = re.compile(r'([uoga]*)([+\-=])([ugo]|[rwx]*)')
 CHMOD_MASKS = {
     'u': stat.S_IRWXU,
     'g': stat.S_IRWXG,
     'o': stat.S_IRWXO,
     'a': (stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO),
 }
-CHMOD_BITS = {
-    'u': {'r': stat.S_IRUSR, 'w': stat.S_IWUSR, 'x': stat.S_IXUSR},
-    'g': {'r': stat.S_IRGRP, 'w': stat.S_IWGRP, 'x': stat.S_IXGRP},
-    'o': {'r': stat.S_IROTH, 'w': stat.S_IWOTH, 'x': stat.S_IXOTH},
-    'a': {
-        'r': (stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH),
-        'w': (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH),
-        'x': (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    }
+#: Index of each user class in :data:`CHMOD_BITS`.
+CHMOD_WHO_INDEX = {'u': 0, 'g': 3, 'o': 6, 'a': 9}
+#: Offset of each permission from its user class in :data:`CHMOD_BITS`.
+CHMOD_PERM_INDEX = {'r': 0, 'w': 1, 'x': 2}
+#: Mode bits for each `(who, perm)` pair, indexed by
+#: ``CHMOD_WHO_INDEX[who] + CHMOD_PERM_INDEX[perm]``.
+CHMOD_BITS = (
+    stat.S_IRUSR, stat.S_IWUSR, stat.S_IXUSR,
+    stat.S_IRGRP, stat.S_IWGRP, stat.S_IXGRP,
+    stat.S_IROTH, stat.S_IWOTH, stat.S_IXOTH,
+    (stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH),
+    (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH),
+    (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH),
+)
+#: Set-ID (``s``) and sticky (``t``) bits granted to each user class.
+CHMOD_SPECIAL_BITS = {
+    'u': {'s': stat.S_ISUID, 't': 0},
+    'g': {'s': stat.S_ISGID, 't': 0},
+    'o': {'s': 0, 't': stat.S_ISVTX},
+    'a': {'s': (stat.S_ISUID | stat.S_ISGID), 't': stat.S_ISVTX},
 }
 
+#: Map of `(spec, search)` to its result from :func:`compile_mode_spec`. The
+#: same handful of specs (e.g. ``u+x``) are applied to every file touched by a
+#: run, so they are parsed only once.
+_compiled_mode_specs = {}
+
+
+def compile_mode_spec(spec, search=False):
+    """
+    Parse a symbolic file mode change specification in the style of chmod(1)
+    `spec` into a tuple of `(op, mask, bits)` integer triples, one for every
+    user class named by each clause, suitable for :func:`apply_mode_spec`.
+
+    :param bool search:
+        If :data:`True`, ``X`` grants execute permission like ``x``, otherwise
+        it is ignored. chmod(1) grants it only to directories and files that
+        are already executable by some user.
+    """
+    key = (spec, search)
+    try:
+        return _compiled_mode_specs[key]
+    except KeyError:
+        pass
+
+    masks = CHMOD_MASKS
+    table = CHMOD_BITS
+    who_index = CHMOD_WHO_INDEX
+    perm_index = CHMOD_PERM_INDEX
+    compiled = []
+    for clause in mitogen.core.to_text(spec).split(u','):
+        # Each clause is [ugoa]*, followed by one or more [+-=][rwxXst]*
+        # actions.
+        n = len(clause)
+        i = n - len(clause.lstrip(u'ugoa'))
+        who = clause[:i] or u'a'
+        if i == n:
+            raise ValueError('invalid mode specification: %r' % (spec,))
+        while i < n:
+            op = clause[i]
+            if op not in u'+-=':
+                raise ValueError('invalid mode specification: %r' % (spec,))
+            i += 1
+            start = i
+            while i < n and clause[i] in u'rwxXst':
+                i += 1
+            perms = clause[start:i]
+            for ch in who:
+                base = who_index[ch]
+                new_perm_bits = 0
+                special_bits = 0
+                for perm in perms:
+                    if perm == u'X':
+                        if not search:
+                            continue
+                        perm = u'x'
+                    if perm in u'st':
+                        special_bits |= CHMOD_SPECIAL_BITS[ch][perm]
+                    else:
+                        new_perm_bits |= table[base + perm_index[perm]]
+                compiled.append((op, masks[ch], new_perm_bits))
+                if special_bits:
+                    compiled.append((op, special_bits, special_bits))
+
+    compiled = tuple(compiled)
+    _compiled_mode_specs[key] = compiled
+    return compiled
+
 
 def apply_mode_spec(spec, mode):
     """
     Given a symbolic file mode change specification in the style of chmod(1)
     `spec`, apply changes in the specification to the numeric file mode `mode`.
     """
-    for clause in mitogen.core.to_text(spec).split(','):
-        match = CHMOD_CLAUSE_PAT.match(clause)
-        who, op, perms = match.groups()
-        for ch in who or 'a':
-            mask = CHMOD_MASKS[ch]
-            bits = CHMOD_BITS[ch]
-            cur_perm_bits = mode & mask
-            new_perm_bits = 0
-            for perm in perms:
-                new_perm_bits |= bits[perm]
-            mode &= ~mask
-            if op == '=':
-                mode |= new_perm_bits
-            elif op == '+':
-                mode |= new_perm_bits | cur_perm_bits
-            else:
-                mode |= cur_perm_bits & ~new_perm_bits
+    search = stat.S_ISDIR(mode) or bool(mode & CHMOD_BITS[11])
+    for op, mask, new_perm_bits in compile_mode_spec(spec, search):
+        cur_perm_bits = mode & mask
+        mode &= ~mask
+        if op == '=':
+            mode |= new_perm_bits
+        elif op == '+':
+            mode |= new_perm_bits | cur_perm_bits
+        else:
+            mode |= cur_perm_bits & ~new_perm_bits
     return mode
 
 
@@ -746,6 +902,27 @@ def set_file_mode(path, spec, fd=None):
         os.chmod(path, new_mode)
 
 
+def set_file_modes(paths, spec):
+    """
+    Apply :func:`set_file_mode` to every path in `paths`, allowing the
+    controller to change many files in a single round-trip.
+    """
+    for path in paths:
+        set_file_mode(path, spec)
+
+
+def set_file_owners(paths, user):
+    """
+    Change the owner of every path in `paths` to the account named `user`
+    and its primary group, allowing the controller to change many files in a
+    single round-trip. The account is looked up on each call, since the play
+    may have created or changed it.
+    """
+    ent = pwd.getpwnam(user)
+    for path in paths:
+        os.chown(path, ent.pw_uid, ent.pw_gid)
+
+
 def file_exists(path):
     """
     Return :data:`True` if `path` exists. This is a wrapper function over
@@ -486,8 +486,11 @@ def fire(obj, name, *args, **kwargs):
     Arrange for `func(*args, **kwargs)` to be invoked for every function
     registered for signal `name` on `obj`.
     """
-    for func in _signals(obj, name):
-        func(*args, **kwargs)
+    # Avoid creating empty signal tables for objects nobody listens to.
+    signals = obj.__dict__.get('_signals')
+    if signals:
+        for func in signals.get(name, ()):
+            func(*args, **kwargs)
 
 
 def takes_econtext(func):
@@ -792,6 +795,40 @@ else:
     _Unpickler = pickle.Unpickler
 
 
+def _compile_struct(fmt):
+    """
+    Return `(pack, unpack)` functions for the :mod:`struct` format `fmt`,
+    using a precompiled :class:`struct.Struct` where one is available.
+    """
+    try:
+        st = struct.Struct(fmt)
+    except AttributeError:
+        # Python 2.4
+        return (lambda *args: struct.pack(fmt, *args),
+                lambda s: struct.unpack(fmt, s))
+    return st.pack, st.unpack
+
+
+def _clamp_pickle_protocol(value, default=2):
+    """
+    Return the pickle protocol named by `value`, lowered to the highest this
+    interpreter supports, or `default` if `value` is :data:`None`.
+
+    :raises Error:
+        `value` is not a non-negative integer.
+    """
+    if value is None:
+        return default
+    try:
+        protocol = int(value)
+    except ValueError:
+        protocol = -1
+    if protocol < 0:
+        raise Error('invalid MITOGEN_PICKLE_PROTOCOL %r: expected an integer '
+                    'from 0 to %d', value, pickle.HIGHEST_PROTOCOL)
+    return min(protocol, pickle.HIGHEST_PROTOCOL)
+
+
 class Message(object):
     """
     Messages are the fundamental unit of communication, comprising fields from
@@ -835,6 +872,19 @@ class Message(object):
     #: the :class:`mitogen.select.Select` interface. Defaults to :data:`None`.
     receiver = None
 
+    #: Pickle protocol used by :meth:`pickled`. This defaults to 2, the highest
+    #: understood by Python 2. Raising it to 3 or above avoids serializing
+    #: :class:`bytes` as a :func:`_codecs.encode` call, which is many times
+    #: faster for large payloads, but messages are pickled before their
+    #: destination is known, so every interpreter in the tree must be able to
+    #: read the chosen protocol: a Python 2 context cannot unpickle protocol 3
+    #: or above. It must be set before any child is constructed, e.g. via the
+    #: ``MITOGEN_PICKLE_PROTOCOL`` environment variable, and is inherited by
+    #: children. Each context lowers it to the highest protocol it can write.
+    pickle_protocol = _clamp_pickle_protocol(
+        os.environ.get('MITOGEN_PICKLE_PROTOCOL')
+    )
+
     HEADER_FMT = '>hLLLLLL'
     HEADER_LEN = struct.calcsize(HEADER_FMT)
     HEADER_MAGIC = 0x4d49  # 'MI'
@@ -849,13 +899,13 @@ class Message(object):
         vars(self).update(kwargs)
         assert isinstance(self.data, BytesType), 'Message data is not Bytes'
 
+    def pack_header(self):
+        return _pack_header(self.HEADER_MAGIC, self.dst_id, self.src_id,
+                            self.auth_id, self.handle, self.reply_to or 0,
+                            len(self.data))
+
     def pack(self):
-        return (
-            struct.pack(self.HEADER_FMT, self.HEADER_MAGIC, self.dst_id,
-                        self.src_id, self.auth_id, self.handle,
-                        self.reply_to or 0, len(self.data))
-            + self.data
-        )
+        return self.pack_header() + self.data
 
     def _unpickle_context(self, context_id, name):
         return _unpickle_context(context_id, name, router=self.router)
@@ -867,29 +917,32 @@ class Message(object):
         s, n = _codecs.latin_1_encode(s)
         return s
 
+    #: Map of `(module, name)` pairs permitted to appear in a pickle to the
+    #: callable they resolve to. String values name a :class:`Message` method,
+    #: for constructors needing access to :attr:`router`.
+    _pickle_globals = {
+        (__name__, '_unpickle_call_error'): _unpickle_call_error,
+        (__name__, 'CallError'): _unpickle_call_error,
+        (__name__, '_unpickle_sender'): '_unpickle_sender',
+        (__name__, '_unpickle_context'): '_unpickle_context',
+        (__name__, 'Blob'): Blob,
+        (__name__, 'Secret'): Secret,
+        (__name__, 'Kwargs'): Kwargs,
+        ('_codecs', 'encode'): '_unpickle_bytes',
+        ('__builtin__', 'bytes'): BytesType,
+    }
+
     def _find_global(self, module, func):
         """
         Return the class implementing `module_name.class_name` or raise
         `StreamError` if the module is not whitelisted.
         """
-        if module == __name__:
-            if func == '_unpickle_call_error' or func == 'CallError':
-                return _unpickle_call_error
-            elif func == '_unpickle_sender':
-                return self._unpickle_sender
-            elif func == '_unpickle_context':
-                return self._unpickle_context
-            elif func == 'Blob':
-                return Blob
-            elif func == 'Secret':
-                return Secret
-            elif func == 'Kwargs':
-                return Kwargs
-        elif module == '_codecs' and func == 'encode':
-            return self._unpickle_bytes
-        elif module == '__builtin__' and func == 'bytes':
-            return BytesType
-        raise StreamError('cannot unpickle %r/%r', module, func)
+        obj = self._pickle_globals.get((module, func))
+        if obj is None:
+            raise StreamError('cannot unpickle %r/%r', module, func)
+        if isinstance(obj, str):
+            return getattr(self, obj)
+        return obj
 
     @property
     def is_dead(self):
@@ -909,6 +962,10 @@ class Message(object):
         kwargs['data'], _ = _codecs.utf_8_encode(reason or u'')
         return cls(reply_to=IS_DEAD, **kwargs)
 
+    #: Serializations of :data:`None`, :data:`True` and :data:`False`, by far
+    #: the most common function return values, keyed by `(obj, protocol)`.
+    _pickled_consts = {}
+
     @classmethod
     def pickled(cls, obj, **kwargs):
         """
@@ -919,11 +976,21 @@ class Message(object):
             The new message.
         """
         self = cls(**kwargs)
+        if obj is None or obj is True or obj is False:
+            key = (obj, cls.pickle_protocol)
+            data = cls._pickled_consts.get(key)
+            if data is None:
+                data = pickle__dumps(obj, protocol=cls.pickle_protocol)
+                cls._pickled_consts[key] = data
+            self.data = data
+            return self
+
         try:
-            self.data = pickle__dumps(obj, protocol=2)
+            self.data = pickle__dumps(obj, protocol=cls.pickle_protocol)
         except pickle.PicklingError:
             e = sys.exc_info()[1]
-            self.data = pickle__dumps(CallError(e), protocol=2)
+            self.data = pickle__dumps(CallError(e),
+                                      protocol=cls.pickle_protocol)
         return self
 
     def reply(self, msg, router=None, **kwargs):
@@ -1015,6 +1082,9 @@ class Message(object):
         )
 
 
+_pack_header, _unpack_header = _compile_struct(Message.HEADER_FMT)
+
+
 class Sender(object):
     """
     Senders are used to send pickled messages to a handle in another context,
@@ -1335,7 +1405,9 @@ class Importer(object):
     def __init__(self, router, context, core_src, whitelist=(), blacklist=()):
         self._log = logging.getLogger('mitogen.importer')
         self._context = context
-        self._present = {'mitogen': self.MITOGEN_PKG_CONTENT}
+        #: Map of package name to a set of its submodule names, consulted
+        #: to refuse requests for submodules known not to exist.
+        self._present = {'mitogen': frozenset(self.MITOGEN_PKG_CONTENT)}
         self._lock = threading.Lock()
         self.whitelist = list(whitelist) or ['']
         self.blacklist = list(blacklist) + self.ALWAYS_BLACKLIST
@@ -1354,7 +1426,9 @@ class Importer(object):
                 'mitogen.core',
                 None,
                 'x/mitogen/core.py',
-                zlib.compress(core_src, 9),
+                # Runs during every child's startup. Level 9 is ~4x slower
+                # than the default, for well under 1% smaller output.
+                zlib.compress(core_src),
                 [],
             )
         self._install_handler(router)
@@ -1625,7 +1699,7 @@ class Importer(object):
         if pkg_present is not None:
             # TODO Namespace packages
             spec.submodule_search_locations = []
-            self._present[spec.name] = pkg_present
+            self._present[spec.name] = frozenset(pkg_present)
 
         module = types.ModuleType(spec.name)
         # FIXME create_module() shouldn't initialise module attributes
@@ -1680,7 +1754,7 @@ class Importer(object):
         if pkg_present is not None:  # it's a package.
             mod.__path__ = []
             mod.__package__ = fullname
-            self._present[fullname] = pkg_present
+            self._present[fullname] = frozenset(pkg_present)
         else:
             mod.__package__ = str_rpartition(fullname, '.')[0] or None
 
@@ -1883,7 +1957,13 @@ class LogHandler(logging.Handler):
 
         self.local.in_emit = True
         try:
-            msg = self.format(rec)
+            if (self.formatter is None and not rec.exc_info and
+                    not getattr(rec, 'exc_text', None) and
+                    not getattr(rec, 'stack_info', None)):
+                # Equivalent to the default formatter's '%(message)s'.
+                msg = rec.getMessage()
+            else:
+                msg = self.format(rec)
             encoded = '%s\x00%s\x00%s' % (rec.name, rec.levelno, msg)
             if isinstance(encoded, UnicodeType):
                 # Logging package emits both :(
@@ -2159,6 +2239,10 @@ class BufferedWriter(object):
         self._buf = collections.deque()
         self._len = 0
 
+    #: Maximum number of buffers passed to a single :meth:`Side.writev` call.
+    #: Comfortably below IOV_MAX on every supported platform.
+    MAX_IOV = 64
+
     def write(self, s):
         """
         Transmit `s` immediately, falling back to enqueuing it and marking the
@@ -2173,7 +2257,7 @@ class BufferedWriter(object):
                 if n:
                     if n == len(s):
                         return
-                    s = s[n:]
+                    s = BufferType(s, n)
             except OSError:
                 pass
 
@@ -2187,17 +2271,26 @@ class BufferedWriter(object):
         :meth:`write` calls.
         """
         if self._buf:
-            buf = self._buf.popleft()
-            written = self._protocol.stream.transmit_side.write(buf)
+            side = self._protocol.stream.transmit_side
+            if len(self._buf) > 1 and hasattr(side, 'writev'):
+                written = side.writev(
+                    list(itertools.islice(self._buf, self.MAX_IOV))
+                )
+            else:
+                written = side.write(self._buf[0])
             if not written:
                 _v and LOG.debug('disconnected during write to %r', self)
                 self._protocol.stream.on_disconnect(broker)
                 return
-            elif written != len(buf):
-                self._buf.appendleft(BufferType(buf, written))
 
             _vv and IOLOG.debug('transmitted %d bytes to %r', written, self)
             self._len -= written
+            while written:
+                buf = self._buf.popleft()
+                if len(buf) > written:
+                    self._buf.appendleft(BufferType(buf, written))
+                    break
+                written -= len(buf)
 
         if not self._buf:
             broker._stop_transmit(self._protocol.stream)
@@ -2315,6 +2408,23 @@ class Side(object):
             return None
         return written
 
+    if hasattr(os, 'writev'):
+        def writev(self, bufs):
+            """
+            Like :meth:`write`, but gather bytes from the sequence of buffers
+            `bufs` using a single :func:`os.writev` call. Only present on
+            Python 3.3+.
+            """
+            if self.closed:
+                return None
+
+            written, disconnected = io_op(os.writev, self.fd, bufs)
+            if disconnected:
+                LOG.debug('%r: disconnected during write: %s',
+                          self, disconnected)
+                return None
+            return written
+
 
 class MitogenProtocol(Protocol):
     """
@@ -2349,6 +2459,10 @@ class MitogenProtocol(Protocol):
         )
         self.sent_modules = set(['mitogen', 'mitogen.core'])
         self._input_buf = collections.deque()
+        #: Offset of the first unconsumed byte in :attr:`_input_buf` [0], so
+        #: many small messages arriving in one read do not each copy the
+        #: remainder of the chunk.
+        self._input_buf_off = 0
         self._input_buf_len = 0
         self._writer = BufferedWriter(router.broker, self)
 
@@ -2363,7 +2477,8 @@ class MitogenProtocol(Protocol):
         """
         _vv and IOLOG.debug('%r.on_receive()', self)
         if self._input_buf and self._input_buf_len < 128:
-            self._input_buf[0] += buf
+            self._input_buf[0] = self._input_buf[0][self._input_buf_off:] + buf
+            self._input_buf_off = 0
         else:
             self._input_buf.append(buf)
 
@@ -2382,16 +2497,17 @@ class MitogenProtocol(Protocol):
         if self._input_buf_len < Message.HEADER_LEN:
             return False
 
+        off = self._input_buf_off
+        buf = self._input_buf[0]
         msg = Message()
         msg.router = self._router
         (magic, msg.dst_id, msg.src_id, msg.auth_id,
-         msg.handle, msg.reply_to, msg_len) = struct.unpack(
-            Message.HEADER_FMT,
-            self._input_buf[0][:Message.HEADER_LEN],
+         msg.handle, msg.reply_to, msg_len) = _unpack_header(
+            buf[off:off + Message.HEADER_LEN],
         )
 
         if magic != Message.HEADER_MAGIC:
-            LOG.error(self.corrupt_msg, self.stream.name, self._input_buf[0][:2048])
+            LOG.error(self.corrupt_msg, self.stream.name, buf[off:off + 2048])
             self.stream.on_disconnect(broker)
             return False
 
@@ -2409,21 +2525,27 @@ class MitogenProtocol(Protocol):
             )
             return False
 
-        start = Message.HEADER_LEN
-        prev_start = start
-        remain = total_len
+        start = off + Message.HEADER_LEN
+        remain = msg_len
         bits = []
-        while remain:
-            buf = self._input_buf.popleft()
-            bit = buf[start:remain]
+        while True:
+            bit = buf[start:start + remain]
             bits.append(bit)
-            remain -= len(bit) + start
-            prev_start = start
+            remain -= len(bit)
+            if not remain:
+                break
+            self._input_buf.popleft()
+            buf = self._input_buf[0]
             start = 0
 
-        msg.data = b('').join(bits)
-        self._input_buf.appendleft(buf[prev_start+len(bit):])
+        end = start + len(bit)
+        if end == len(buf):
+            self._input_buf.popleft()
+            end = 0
+        self._input_buf_off = end
         self._input_buf_len -= total_len
+
+        msg.data = b('').join(bits)
         self._router._async_route(msg, self.stream)
         return True
 
@@ -2445,9 +2567,19 @@ class MitogenProtocol(Protocol):
         _vv and IOLOG.debug('%r.on_transmit()', self)
         self._writer.on_transmit(broker)
 
+    #: Messages with at least this many bytes of data are written as
+    #: separate header and data buffers, rather than copying the data into a
+    #: single packed string. Any resulting queued buffers are gathered by
+    #: :meth:`Side.writev` where it is available.
+    SPLIT_SEND_SIZE = 65536
+
     def _send(self, msg):
         _vv and IOLOG.debug('%r._send(%r)', self, msg)
-        self._writer.write(msg.pack())
+        if len(msg.data) < self.SPLIT_SEND_SIZE:
+            self._writer.write(msg.pack())
+        else:
+            self._writer.write(msg.pack_header())
+            self._writer.write(msg.data)
 
     def send(self, msg):
         """
@@ -3017,9 +3149,14 @@ class Waker(Protocol):
 
     .. _UNIX self-pipe trick: https://cr.yp.to/docs/selfpipe.html
     """
-    read_size = 1
+    #: Enough to drain any wakes that raced with :meth:`on_receive` in one
+    #: read, rather than one poll iteration per byte.
+    read_size = 128
     broker_ident = None
 
+    #: Byte written by :meth:`_wake`, encoded once rather than per wake.
+    wake_byte = b(' ')
+
     @classmethod
     def build_stream(cls, broker):
         stream = super(Waker, cls).build_stream(broker)
@@ -3030,6 +3167,9 @@ class Waker(Protocol):
     def __init__(self, broker):
         self._broker = broker
         self._deferred = collections.deque()
+        # Serializes defer() callers, so exactly one of them sees the queue
+        # become non-empty and writes the wake byte.
+        self._lock = threading.Lock()
 
     def __repr__(self):
         return 'Waker(fd=%r/%r)' % (
@@ -3047,8 +3187,10 @@ class Waker(Protocol):
     def on_receive(self, broker, buf):
         """
         Drain the pipe and fire callbacks. Since :attr:`_deferred` is
-        synchronized, :meth:`defer` and :meth:`on_receive` can conspire to
-        ensure only one byte needs to be pending regardless of queue length.
+        synchronized, :meth:`defer` and :meth:`on_receive` conspire to ensure
+        only one byte needs to be pending regardless of queue length: the pipe
+        is only written when the queue transitions from empty to non-empty,
+        and this loop runs until the queue is empty.
         """
         _vv and IOLOG.debug('%r.on_receive()', self)
         while True:
@@ -3070,7 +3212,7 @@ class Waker(Protocol):
         teardown, the FD may already be closed, so ignore EBADF.
         """
         try:
-            self.stream.transmit_side.write(b(' '))
+            self.stream.transmit_side.write(self.wake_byte)
         except OSError:
             e = sys.exc_info()[1]
             if e.args[0] not in (errno.EBADF, errno.EWOULDBLOCK):
@@ -3099,8 +3241,15 @@ class Waker(Protocol):
 
         _vv and IOLOG.debug('%r.defer() [fd=%r]', self,
                             self.stream.transmit_side.fd)
-        self._deferred.append((func, args, kwargs))
-        self._wake()
+        self._lock.acquire()
+        try:
+            self._deferred.append((func, args, kwargs))
+            wake = len(self._deferred) == 1
+        finally:
+            self._lock.release()
+
+        if wake:
+            self._wake()
 
 
 class IoLoggerProtocol(DelimitedProtocol):
@@ -3884,6 +4033,8 @@ class Dispatcher(object):
         self.econtext = econtext
         #: Chain ID -> CallError if prior call failed.
         self._error_by_chain_id = {}
+        #: Module name -> module, for modules a prior call has imported.
+        self._module_by_name = {}
         self.recv = Receiver(
             router=econtext.router,
             handle=CALL_FUNCTION,
@@ -3917,7 +4068,12 @@ class Dispatcher(object):
         _v and LOG.debug('%r: dispatching %r', self, data)
 
         chain_id, modname, klass, func, args, kwargs = data
-        obj = import_module(modname)
+        # __import__() costs a microsecond even for an imported module, and
+        # on Python 2 it contends for the import lock. The attribute lookups
+        # below are repeated every time so patched functions are respected.
+        obj = self._module_by_name.get(modname)
+        if obj is None:
+            obj = self._module_by_name[modname] = import_module(modname)
         if klass:
             obj = getattr(obj, klass)
         fn = getattr(obj, func)
@@ -4074,6 +4230,9 @@ class ExternalContext(object):
 
     def _setup_master(self):
         Router.max_message_size = self.config['max_message_size']
+        Message.pickle_protocol = _clamp_pickle_protocol(
+            self.config.get('pickle_protocol')
+        )
         if self.config['profiling']:
             enable_profiling()
         self.broker = Broker(activate_compat=False)
@@ -139,7 +139,8 @@ class IoPump(mitogen.core.Protocol):
 
     def on_transmit(self, stream, broker):
         written = self.transmit_side.write(self._output_buf)
-        IOLOG.debug('%r.on_transmit() -> len %r', self, written)
+        mitogen.core._vv and IOLOG.debug('%r.on_transmit() -> len %r',
+                                         self, written)
         if written is None:
             self.on_disconnect(broker)
         else:
@@ -152,7 +153,8 @@ class IoPump(mitogen.core.Protocol):
 
     def on_receive(self, stream, broker):
         s = stream.receive_side.read()
-        IOLOG.debug('%r.on_receive() -> len %r', self, len(s))
+        mitogen.core._vv and IOLOG.debug('%r.on_receive() -> len %r',
+                                         self, len(s))
         if s:
             mitogen.core.fire(self, 'receive', s)
         else:
@@ -202,12 +204,13 @@ class Process(object):
 
     def _on_stdin(self, msg):
         if msg.is_dead:
-            IOLOG.debug('%r._on_stdin() -> %r', self, msg)
+            mitogen.core._vv and IOLOG.debug('%r._on_stdin() -> %r', self, msg)
             self.pump.protocol.close()
             return
 
         data = msg.unpickle()
-        IOLOG.debug('%r._on_stdin() -> len %d', self, len(data))
+        mitogen.core._vv and IOLOG.debug('%r._on_stdin() -> len %d',
+                                         self, len(data))
         self.pump.protocol.write(data)
 
     def _on_control(self, msg):
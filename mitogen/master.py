@@ -35,6 +35,7 @@ be sent to any context that will be used to establish additional child
 contexts.
 """
 
+import collections
 import errno
 import inspect
 import logging
@@ -149,15 +150,15 @@ def is_stdlib_name(modname):
     return is_stdlib_path(modpath)
 
 
-_STDLIB_PATHS = _stdlib_paths()
+# Tuple, for str.startswith().
+_STDLIB_PATHS = tuple(p for p in _stdlib_paths() if p)
 
 
 def is_stdlib_path(path):
-    return any(
-        os.path.commonprefix((libpath, path)) == libpath
+    return (
+        path.startswith(_STDLIB_PATHS)
         and 'site-packages' not in path
         and 'dist-packages' not in path
-        for libpath in _STDLIB_PATHS
     )
 
 
@@ -1002,10 +1003,12 @@ class ModuleFinder(object):
                 for name in namelist
             )
 
+        # maybe_names repeats a module for every statement importing from it,
+        # so deduplicate before paying for _reject_related_module().
         return self._related_cache.setdefault(fullname, sorted(
             set(
                 mitogen.core.to_text(name)
-                for name in maybe_names
+                for name in set(maybe_names)
                 if not self._reject_related_module(fullname, name)
             )
         ))
@@ -1022,13 +1025,13 @@ class ModuleFinder(object):
             for which source code can be retrieved
         :type fullname: str
         """
-        stack = [fullname]
+        queue = collections.deque([fullname])
         found = set()
 
-        while stack:
-            name = stack.pop(0)
-            names = self.find_related_imports(name)
-            stack.extend(set(names).difference(set(found).union(stack)))
+        while queue:
+            names = self.find_related_imports(queue.popleft())
+            # Everything ever queued is already in found.
+            queue.extend(set(names).difference(found))
             found.update(names)
 
         found.discard(fullname)
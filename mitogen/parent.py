@@ -847,18 +847,14 @@ class Argv(object):
 
     must_escape = frozenset('\\$"`!')
     must_escape_or_space = must_escape | frozenset(' ')
+    must_escape_re = re.compile(r'([\\$"`!])')
 
     def escape(self, x):
         if not self.must_escape_or_space.intersection(x):
             return x
-
-        s = '"'
-        for c in x:
-            if c in self.must_escape:
-                s += '\\'
-            s += c
-        s += '"'
-        return s
+        # Boot commands embed a large base64 blob, so avoid a per-character
+        # loop.
+        return '"%s"' % (self.must_escape_re.sub(r'\\\1', x),)
 
     def __str__(self):
         return ' '.join(map(self.escape, self.argv))
@@ -1470,8 +1466,18 @@ class Connection(object):
             return self.options.python_path
         return [self.options.python_path]
 
-    def get_boot_command(self):
-        lines = inspect.getsourcelines(self._first_stage)[0][2:]
+    @classmethod
+    def _get_encoded_first_stage(cls):
+        """
+        Return the compressed, base64-encoded :meth:`_first_stage` source.
+        Fetching and compressing the source costs milliseconds, so it is done
+        once per class and cached.
+        """
+        encoded = cls.__dict__.get('_encoded_first_stage')
+        if encoded is not None:
+            return encoded
+
+        lines = inspect.getsourcelines(cls._first_stage)[0][2:]
         # Remove line comments, leading indentation, trailing newline
         source = textwrap.dedent(''.join(s for s in lines if '#' not in s))[:-1]
         source = source.replace('    ', ' ')
@@ -1480,7 +1486,11 @@ class Connection(object):
         )
         compressed = compressor.compress(source.encode()) + compressor.flush()
         encoded = binascii.b2a_base64(compressed).replace(b('\n'), b(''))
+        cls._encoded_first_stage = encoded = encoded.decode()
+        return encoded
 
+    def get_boot_command(self):
+        encoded = self._get_encoded_first_stage()
         # Just enough to decode, decompress, and exec the first stage.
         # Priorities: wider compatibility, faster startup, shorter length.
         # `sys.path=...` for https://github.com/python/cpython/issues/115911.
@@ -1490,7 +1500,7 @@ class Connection(object):
             'import sys;sys.path=[p for p in sys.path if p];'
             'import binascii,os,select,zlib;'
             'exec(zlib.decompress(binascii.a2b_base64(sys.argv[1]),-15))',
-            encoded.decode(),
+            encoded,
             self.options.remote_name,
             str(len(self.get_preamble())),
         ]
@@ -1509,6 +1519,7 @@ class Connection(object):
             'whitelist': self._router.get_module_whitelist(),
             'blacklist': self._router.get_module_blacklist(),
             'max_message_size': self.options.max_message_size,
+            'pickle_protocol': mitogen.core.Message.pickle_protocol,
             'version': mitogen.__version__,
         }
 
@@ -67,9 +67,10 @@ def disable_site_packages():
     :attr:sys.path. Used primarily for testing on OS X within a virtualenv,
     where OS X bundles some ancient version of the :mod:`six` module.
     """
-    for entry in sys.path[:]:
-        if 'site-packages' in entry or 'Extras' in entry:
-            sys.path.remove(entry)
+    sys.path[:] = [
+        entry for entry in sys.path
+        if 'site-packages' not in entry and 'Extras' not in entry
+    ]
 
 
 def _formatTime(record, datefmt=None):
@@ -208,10 +209,14 @@ def cast(obj):
     :returns:
         Undecorated object.
     """
+    fn = _CAST_DISPATCH.get(type(obj))
+    if fn is not None:
+        return fn(obj)
+
     if isinstance(obj, dict):
-        return dict((cast(k), cast(v)) for k, v in iteritems(obj))
+        return _cast_to_dict(obj)
     if isinstance(obj, (list, tuple)):
-        return [cast(v) for v in obj]
+        return _cast_to_list(obj)
     if isinstance(obj, PASSTHROUGH):
         return obj
     if isinstance(obj, mitogen.core.UnicodeType):
@@ -222,6 +227,39 @@ def cast(obj):
     raise TypeError("Cannot serialize: %r: %r" % (type(obj), obj))
 
 
+def _cast_to_dict(obj):
+    """
+    Return a plain :class:`dict` of `obj` with each key and value cast.
+    """
+    return dict((cast(k), cast(v)) for k, v in iteritems(obj))
+
+
+def _cast_to_list(obj):
+    """
+    Return a plain :class:`list` of `obj` with each item cast.
+    """
+    return [cast(v) for v in obj]
+
+
+def _passthrough(obj):
+    """
+    Return `obj` unchanged; its exact type needs no cast.
+    """
+    return obj
+
+
+#: Exact type -> cast function, avoiding the isinstance() chain in
+#: :func:`cast` for builtins. Subtypes still take the slow path.
+_CAST_DISPATCH = dict((t, _passthrough) for t in PASSTHROUGH)
+_CAST_DISPATCH.update({
+    dict: _cast_to_dict,
+    list: _cast_to_list,
+    tuple: _cast_to_list,
+    mitogen.core.BytesType: _passthrough,
+    mitogen.core.UnicodeType: _passthrough,
+})
+
+
 def _cast(obj, desired_type):
     result = desired_type(obj)
     if type(result) is not desired_type:
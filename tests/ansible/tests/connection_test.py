@@ -87,6 +87,40 @@ class MuxShutdownTest(ConnectionMixin, testlib.TestCase):
             os.rename(path + '.tmp', path)
 
 
+class BindingLifetimeTest(ConnectionMixin, testlib.TestCase):
+    def test_reconnect_after_action_run(self):
+        # e.g. with_items: each loop item drops the context and reconnects
+        # using the same binding, which close() must still release.
+        for _ in range(2):
+            self.conn.on_action_run(
+                task_vars={},
+                delegate_to_hostname=None,
+                loader_basedir=None,
+            )
+            self.conn.get_chain().call(os.getpid)
+        binding = self.conn.binding
+        self.assertIs(binding, self.model.binding)
+        self.conn.close()
+        self.assertTrue(binding.closed)
+        self.assertIsNone(self.model.binding)
+        self.assertIsNone(self.model.broker)
+
+    def test_replaced_without_close(self):
+        # e.g. delegate_to: "{{ item }}": TaskExecutor swaps in a connection
+        # for each new remote_addr, never closing the one it replaces.
+        self.conn.get_chain().call(os.getpid)
+        old_binding = self.conn.binding
+        self.conn = self.make_connection()
+        self.conn.get_chain().call(os.getpid)
+        self.assertTrue(old_binding.closed)
+        old_binding.close()
+        self.assertIsNotNone(self.model.broker)
+
+        self.conn.close()
+        self.assertIsNone(self.model.binding)
+        self.assertIsNone(self.model.broker)
+
+
 class OptionalIntTest(testlib.TestCase):
     func = staticmethod(ansible_mitogen.connection.optional_int)
 
@@ -0,0 +1,85 @@
+import datetime
+import json
+import math
+import sys
+import unittest
+
+import ansible_mitogen._json
+
+
+class DumpsTest(unittest.TestCase):
+    func = staticmethod(ansible_mitogen._json.dumps)
+
+    def test_roundtrip(self):
+        dct = {u'a': [1, 2.5, None, True], u'b': u'☃/x'}
+        encoded = self.func(dct)
+        self.assertIsInstance(encoded, type(u''))
+        self.assertEqual(dct, json.loads(encoded))
+
+    def test_non_ascii_escaped(self):
+        dct = {u'snowman': u'☃'}
+        self.assertEqual(json.dumps(dct), self.func(dct))
+
+    def test_non_ascii_unescaped(self):
+        encoded = self.func({u'snowman': u'☃'}, ensure_ascii=False)
+        self.assertIn(u'☃', encoded)
+
+    def test_surrogates_escaped(self):
+        dct = {u'path': u'caf\udce9'}
+        self.assertEqual(json.dumps(dct), self.func(dct))
+
+    def test_non_str_keys(self):
+        self.assertEqual({u'1': u'x'}, json.loads(self.func({1: u'x'})))
+
+    def test_big_int(self):
+        self.assertEqual({u'n': 2**70}, json.loads(self.func({u'n': 2**70})))
+
+    def test_non_finite(self):
+        dct = {u'a': float('nan'), u'b': float('inf'), u'c': float('-inf')}
+        self.assertEqual(json.dumps(dct), self.func(dct))
+
+    def test_unsupported_type(self):
+        self.assertRaises(TypeError, self.func, {u'd': datetime.date.today()})
+
+
+class LoadsTest(unittest.TestCase):
+    func = staticmethod(ansible_mitogen._json.loads)
+
+    def test_text(self):
+        self.assertEqual({u'a': 1}, self.func(u'{"a": 1}'))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, self.func, u'{')
+
+    def test_non_finite(self):
+        dct = self.func(u'{"a": NaN, "b": Infinity, "c": -Infinity}')
+        self.assertTrue(math.isnan(dct[u'a']))
+        self.assertEqual(float('inf'), dct[u'b'])
+        self.assertEqual(float('-inf'), dct[u'c'])
+
+    def test_big_int(self):
+        for n in (2**64, -2**63 - 1, 2**70):
+            value = self.func(u'{"n": %d}' % (n,))[u'n']
+            self.assertEqual(n, value)
+            self.assertIsInstance(value, type(n))
+
+    def test_bytes(self):
+        self.assertEqual({u'n': 2**70}, self.func(b'{"n": %d}' % (2**70,)))
+
+
+class DumpbTest(unittest.TestCase):
+    func = staticmethod(ansible_mitogen._json.dumpb)
+
+    def test_bytes(self):
+        encoded = self.func({u'snowman': u'☃'}, ensure_ascii=False)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual({u'snowman': u'☃'}, json.loads(encoded.decode('utf-8')))
+
+    def test_ascii(self):
+        self.assertEqual(b'{"snowman": "\\u2603"}', self.func({u'snowman': u'☃'}))
+
+    @unittest.skipIf(sys.version_info < (3, 0), 'Python 3 only')
+    def test_surrogateescape(self):
+        name = b'caf\xe9'.decode('utf-8', 'surrogateescape')
+        encoded = self.func({u'path': name}, ensure_ascii=False)
+        self.assertIn(b'caf\xe9', encoded)
@@ -0,0 +1,42 @@
+import json
+import tempfile
+import unittest
+
+import ansible.module_utils.basic
+
+import ansible_mitogen.runner
+
+
+class RunnerJsonArgsTest(unittest.TestCase):
+    klass = ansible_mitogen.runner.Runner
+
+    def make_runner(self, json_args):
+        return self.klass(
+            module='x',
+            service_context=None,
+            json_args=json_args,
+            good_temp_dir=tempfile.gettempdir(),
+        )
+
+    def test_ascii_reused(self):
+        json_args = u'{"path":  "/tmp"}'
+        self.assertEqual(json_args, self.make_runner(json_args).json_args)
+
+    def test_non_ascii_escaped(self):
+        args = {u'path': u'caf\udce9', u'snowman': u'☃'}
+        runner = self.make_runner(u'{"path": "caf\udce9", '
+                                  u'"snowman": "☃"}')
+        self.assertEqual(args, runner.args)
+        self.assertEqual(json.dumps(args), runner.json_args)
+
+    def test_new_style_stdio(self):
+        runner = self.make_runner(u'{"path": "caf\udce9"}')
+        stdio = ansible_mitogen.runner.NewStyleStdio(runner.json_args,
+                                                     runner.good_temp_dir)
+        try:
+            self.assertEqual(
+                {u'ANSIBLE_MODULE_ARGS': {u'path': u'caf\udce9'}},
+                json.loads(ansible.module_utils.basic._ANSIBLE_ARGS.decode()),
+            )
+        finally:
+            stdio.revert()
@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 import os.path
 import subprocess
+import stat
 import tempfile
 import unittest
 
@@ -68,6 +69,60 @@ class ApplyModeSpecTest(unittest.TestCase):
         spec = 'g-rw'
         self.assertEqual(int('0717', 8), self.func(spec, int('0777', 8)))
 
+    def test_repeated_spec(self):
+        for _ in range(2):
+            self.assertEqual(int('0755', 8), self.func('u=rwx,go=rx', 0))
+            self.assertEqual(int('0644', 8), self.func('a-x', int('0755', 8)))
+
+    def test_conditional_execute(self):
+        self.assertEqual(int('0600', 8), self.func('u+rX', int('0600', 8)))
+        self.assertEqual(int('0644', 8), self.func('a+rX', int('0600', 8)))
+        self.assertEqual(int('0755', 8), self.func('a+rX', int('0700', 8)))
+        self.assertEqual(int('0755', 8), self.func('go+rX', int('0711', 8)))
+        directory = stat.S_IFDIR | int('0700', 8)
+        self.assertEqual(stat.S_IFDIR | int('0755', 8),
+                         self.func('a+rX', directory))
+
+    def test_special_bits(self):
+        self.assertEqual(int('04755', 8), self.func('u+s', int('0755', 8)))
+        self.assertEqual(int('02755', 8), self.func('g+s', int('0755', 8)))
+        self.assertEqual(int('06755', 8), self.func('a+s', int('0755', 8)))
+        self.assertEqual(int('01777', 8), self.func('+t', int('0777', 8)))
+        self.assertEqual(int('01777', 8), self.func('o+t', int('0777', 8)))
+        self.assertEqual(int('0755', 8), self.func('ug-s', int('06755', 8)))
+        self.assertEqual(int('04700', 8), self.func('u=rwxs', 0))
+
+
+class CompileModeSpecTest(unittest.TestCase):
+    func = staticmethod(ansible_mitogen.target.compile_mode_spec)
+
+    def test_simple(self):
+        self.assertEqual(
+            (('+', int('0700', 8), int('0100', 8)),),
+            self.func('u+x'),
+        )
+
+    def test_default_who(self):
+        self.assertEqual((('=', int('0777', 8), int('0444', 8)),),
+                         self.func('=r'))
+
+    def test_multiple_actions(self):
+        self.assertEqual(
+            (('+', int('0700', 8), int('0400', 8)),
+             ('-', int('0700', 8), int('0200', 8))),
+            self.func('u+r-w'),
+        )
+
+    def test_invalid(self):
+        for spec in ('u', 'u+rq', 'z+r', 'u=g'):
+            self.assertRaises(ValueError, self.func, spec)
+
+    def test_conditional_execute(self):
+        self.assertEqual((('+', int('0700', 8), int('0400', 8)),),
+                         self.func('u+rX'))
+        self.assertEqual((('+', int('0700', 8), int('0500', 8)),),
+                         self.func('u+rX', search=True))
+
 
 class IsGoodTempDirTest(unittest.TestCase):
     func = staticmethod(ansible_mitogen.target.is_good_temp_dir)
@@ -108,3 +163,111 @@ class IsGoodTempDirTest(unittest.TestCase):
         os_access.return_value = False
         with NamedTemporaryDirectory() as temp_path:
             self.assertFalse(self.func(temp_path))
+
+
+class ReadWritePathTest(unittest.TestCase):
+    def test_roundtrip(self):
+        data = b'x' * (3 * 131072 + 1)
+        with NamedTemporaryDirectory() as temp_path:
+            path = os.path.join(temp_path, 'bleh')
+            ansible_mitogen.target.write_path(path, data, mode='0640',
+                                              sync=True)
+            self.assertEqual(int('0640', 8), os.stat(path).st_mode & int('0777', 8))
+            self.assertEqual(data, ansible_mitogen.target.read_path(path))
+
+    def test_read_unsized(self):
+        # /proc files report st_size == 0 but have content.
+        s = ansible_mitogen.target.read_path('/proc/self/status')
+        self.assertIn(b'Pid:', s)
+
+
+class SetFileOwnersTest(unittest.TestCase):
+    func = staticmethod(ansible_mitogen.target.set_file_owners)
+
+    @mock.patch('os.chown')
+    @mock.patch('pwd.getpwnam')
+    def test_account_changed(self, pwd_getpwnam, os_chown):
+        # e.g. a play creates the account, or changes its UID, between tasks.
+        pwd_getpwnam.return_value = mock.Mock(pw_uid=1234, pw_gid=1234)
+        self.func(['/a', '/b'], 'bob')
+        pwd_getpwnam.return_value = mock.Mock(pw_uid=4321, pw_gid=4321)
+        self.func(['/a'], 'bob')
+        self.assertEqual(
+            [mock.call('/a', 1234, 1234), mock.call('/b', 1234, 1234),
+             mock.call('/a', 4321, 4321)],
+            os_chown.mock_calls,
+        )
+
+
+class SplitSimpleCommandTest(unittest.TestCase):
+    func = staticmethod(ansible_mitogen.target.split_simple_command)
+
+    def test_simple(self):
+        self.assertEqual([u'ls', u'-l', u'/tmp'], self.func(u'ls  -l /tmp'))
+
+    def test_shell_syntax(self):
+        for cmd in (u'echo $HOME', u'a; b', u'a | b', u'echo ~', u'A=1 b',
+                    u"echo 'x'", u'ls *.py', u'a\nb', u''):
+            self.assertIsNone(self.func(cmd))
+
+    def test_shell_words(self):
+        self.assertIsNone(self.func(u'exit 3'))
+        self.assertIsNone(self.func(u'cd /'))
+        self.assertIsNone(self.func(u'time ls'))
+
+    def test_builtins(self):
+        for cmd in (u'echo -e x', u'printf x', u'test -d /', u'pwd',
+                    u'kill %1', u'true', u'false'):
+            self.assertIsNone(self.func(cmd))
+
+    def test_non_ascii_whitespace(self):
+        # Only space and tab separate words; the shell passes U+00A0 through.
+        self.assertEqual([u'basename', u'a\xa0b'],
+                         self.func(u'basename a\xa0b'))
+        self.assertEqual([u'ls', u'-l'], self.func(u'\tls \t-l '))
+
+
+class ExecCommandTest(unittest.TestCase):
+    func = staticmethod(ansible_mitogen.target.exec_command)
+
+    def exec_args_calls(self, cmd, user_shell='/bin/sh', environ={}):
+        exec_args = mock.Mock(return_value=(0, b'', b''))
+        with mock.patch('ansible_mitogen.target.get_user_shell',
+                        return_value=user_shell), \
+                mock.patch('ansible_mitogen.target.exec_args', exec_args), \
+                mock.patch.dict(os.environ, environ):
+            if 'BASH_ENV' not in environ:
+                os.environ.pop('BASH_ENV', None)
+            self.func(cmd)
+        return [call[1]['args'] for call in exec_args.call_args_list]
+
+    def test_direct(self):
+        self.assertEqual([[u'uname', u'-s']], self.exec_args_calls(u'uname -s'))
+
+    def test_direct_output(self):
+        self.assertEqual((0, b'a\xc2\xa0b\n', b''),
+                         self.func(u'basename a\xa0b'))
+
+    def test_builtin_via_shell(self):
+        self.assertEqual([['/bin/sh', '-c', u'echo -e x']],
+                         self.exec_args_calls(u'echo -e x'))
+
+    def test_other_shell(self):
+        for user_shell in ('/bin/rbash', '/usr/sbin/nologin', '/bin/zsh'):
+            self.assertEqual([[user_shell, '-c', u'uname -s']],
+                             self.exec_args_calls(u'uname -s', user_shell))
+
+    def test_bash_env(self):
+        self.assertEqual(
+            [['/bin/bash', '-c', u'uname -s']],
+            self.exec_args_calls(u'uname -s', '/bin/bash',
+                                 {'BASH_ENV': '/etc/bash_env'}),
+        )
+
+    def test_shell(self):
+        self.assertEqual((3, b'', b''), self.func(u'exit 3'))
+        self.assertEqual((0, b'x\n', b''), self.func(u'echo x; true'))
+
+    def test_missing_falls_back_to_shell(self):
+        rc, stdout, stderr = self.func(u'ansible-mitogen-nonexistent')
+        self.assertEqual(127, rc)
@@ -0,0 +1,40 @@
+import os
+
+import testlib
+
+import ansible_mitogen.runner
+
+
+klass = ansible_mitogen.runner.TemporaryEnvironment
+
+
+class TemporaryEnvironmentTest(testlib.TestCase):
+    def setUp(self):
+        self.original_env = os.environ.copy()
+        os.environ['MITOGEN_TEST_KEEP'] = 'keep'
+        os.environ['MITOGEN_TEST_DELETE'] = 'delete'
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_apply(self):
+        env = klass({
+            'MITOGEN_TEST_NEW': 'new',
+            'MITOGEN_TEST_DELETE': None,
+        })
+        try:
+            self.assertEqual('new', os.environ['MITOGEN_TEST_NEW'])
+            self.assertNotIn('MITOGEN_TEST_DELETE', os.environ)
+            self.assertEqual('keep', os.environ['MITOGEN_TEST_KEEP'])
+        finally:
+            env.revert()
+
+    def test_revert(self):
+        expected = dict(os.environ)
+        env = klass({'MITOGEN_TEST_NEW': 'new', 'MITOGEN_TEST_DELETE': None})
+        # Changes made by the module itself are reverted too.
+        os.environ['MITOGEN_TEST_KEEP'] = 'changed'
+        os.environ['MITOGEN_TEST_MODULE'] = 'module'
+        env.revert()
+        self.assertEqual(expected, dict(os.environ))
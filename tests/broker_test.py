@@ -1,3 +1,5 @@
+import threading
+
 try:
     from unittest import mock
 except ImportError:
@@ -34,6 +36,26 @@ class DeferTest(testlib.TestCase):
             broker.shutdown()
             broker.join()
 
+    def test_defer_many_threads(self):
+        latch = mitogen.core.Latch()
+        broker = self.klass()
+
+        def worker():
+            for i in range(1000):
+                broker.defer(latch.put, i)
+
+        try:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(8 * 1000, len([latch.get(timeout=5.0)
+                                            for _ in range(8 * 1000)]))
+        finally:
+            broker.shutdown()
+            broker.join()
+
     def test_defer_after_shutdown(self):
         latch = mitogen.core.Latch()
         broker = self.klass()
@@ -0,0 +1,74 @@
+import os
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import mitogen.core
+
+import testlib
+
+from mitogen.core import b
+
+
+class OnTransmitTest(testlib.TestCase):
+    klass = mitogen.core.BufferedWriter
+
+    def setUp(self):
+        super(OnTransmitTest, self).setUp()
+        self.rfp, self.wfp = mitogen.core.pipe(blocking=False)
+        self.broker = mock.Mock()
+        self.protocol = mock.Mock()
+        self.protocol.stream.transmit_side = mitogen.core.Side(
+            self.protocol.stream, self.wfp
+        )
+        self.writer = self.klass(self.broker, self.protocol)
+
+    def tearDown(self):
+        self.protocol.stream.transmit_side.close()
+        self.rfp.close()
+        super(OnTransmitTest, self).tearDown()
+
+    def fill_pipe(self):
+        # Make write() queue its argument rather than transmitting it.
+        filled = 0
+        try:
+            while True:
+                filled += os.write(self.wfp.fileno(), b('x') * 65536)
+        except (IOError, OSError):
+            pass
+        return filled
+
+    def drain(self, n):
+        s = b('')
+        while len(s) < n:
+            s += os.read(self.rfp.fileno(), n - len(s))
+        return s
+
+    def test_queued_buffers_transmitted_in_order(self):
+        filled = self.fill_pipe()
+        bufs = [b(str(i)) * (i * 1000) for i in range(1, 20)]
+        for buf in bufs:
+            self.writer.write(buf)
+        self.assertEqual(sum(len(buf) for buf in bufs), self.writer._len)
+
+        expect = b('').join(bufs)
+        got = b('')
+        self.drain(filled)
+        while self.writer._len:
+            self.writer.on_transmit(self.broker)
+            got += self.drain(len(expect) - len(got) - self.writer._len)
+        self.assertEqual(expect, got)
+        self.assertEqual(1, self.broker._stop_transmit.call_count)
+
+    def test_partial_write(self):
+        s = b('x') * 1048576 + b('y')
+        self.writer.write(s)
+        self.assertTrue(0 < self.writer._len < len(s))
+
+        got = self.drain(len(s) - self.writer._len)
+        while self.writer._len:
+            self.writer.on_transmit(self.broker)
+            got += self.drain(len(s) - len(got) - self.writer._len)
+        self.assertEqual(s, got)
@@ -77,6 +77,44 @@ class BufferingTest(testlib.TestCase):
         self.assertEqual(b('name\x0099\x00msg'), msg.data)
 
 
+class EmitTest(testlib.TestCase):
+    klass = mitogen.core.LogHandler
+
+    def emit(self, handler, **kwargs):
+        rec = logging.LogRecord(name='name', level=99, pathname='pathname',
+                                lineno=123, msg='msg %s', args=('arg',),
+                                exc_info=None)
+        vars(rec).update(kwargs)
+        handler.emit(rec)
+        msg, = handler._buffer
+        return msg.data
+
+    def test_default_format(self):
+        handler = self.klass(mock.Mock())
+        self.assertEqual(b('name\x0099\x00msg arg'), self.emit(handler))
+
+    def test_exc_info(self):
+        handler = self.klass(mock.Mock())
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            data = self.emit(handler, exc_info=sys.exc_info())
+        self.assertTrue(data.startswith(b('name\x0099\x00msg arg\nTraceback')))
+        self.assertIn(b('ValueError: boom'), data)
+
+    def test_exc_text(self):
+        # e.g. a record already formatted by another handler, carrying only
+        # the rendered traceback.
+        handler = self.klass(mock.Mock())
+        data = self.emit(handler, exc_text='Traceback: boom')
+        self.assertEqual(b('name\x0099\x00msg arg\nTraceback: boom'), data)
+
+    def test_formatter(self):
+        handler = self.klass(mock.Mock())
+        handler.setFormatter(logging.Formatter('[%(message)s]'))
+        self.assertEqual(b('name\x0099\x00[msg arg]'), self.emit(handler))
+
+
 class StartupTest(testlib.RouterMixin, testlib.TestCase):
     def test_earliest_messages_logged(self):
         log = testlib.LogCapturer()
@@ -1,3 +1,4 @@
+import pickle
 import sys
 import struct
 import unittest
@@ -172,6 +173,11 @@ class PickledTest(testlib.TestCase):
         for b in True, False:
             self.assertEqual(b, self.roundtrip(b))
 
+    def test_none(self):
+        self.assertIsNone(self.roundtrip(None))
+        self.assertIs(self.klass.pickled(None).data,
+                      self.klass.pickled(None).data)
+
     @unittest.skipIf(condition=sys.version_info < (2, 6),
                       reason='bytearray missing on <2.6')
     def test_bytearray(self):
@@ -293,6 +299,36 @@ class PickledTest(testlib.TestCase):
         )
 
 
+@unittest.skipIf(condition=sys.version_info < (3, 0),
+                 reason='pickle protocol 4 requires Python 3')
+class PickledProtocol4Test(PickledTest):
+    klass = type('Message', (mitogen.core.Message,), {'pickle_protocol': 4})
+
+    def test_protocol(self):
+        msg = self.klass.pickled(b('123'))
+        self.assertEqual(bytearray([0x80, 4]), bytearray(msg.data[:2]))
+
+
+class ClampPickleProtocolTest(testlib.TestCase):
+    func = staticmethod(mitogen.core._clamp_pickle_protocol)
+
+    def test_default(self):
+        self.assertEqual(2, self.func(None))
+
+    def test_valid(self):
+        self.assertEqual(0, self.func('0'))
+        self.assertEqual(2, self.func(2))
+
+    def test_clamped(self):
+        self.assertEqual(pickle.HIGHEST_PROTOCOL, self.func('99'))
+
+    def test_invalid(self):
+        for value in ('', 'x', '-1'):
+            e = self.assertRaises(mitogen.core.Error,
+                                  lambda: self.func(value))
+            self.assertIn(repr(value), str(e))
+
+
 class ReplyTest(testlib.TestCase):
     # getting_started.html#rpc-serialization-rules
     klass = mitogen.core.Message
@@ -29,3 +29,44 @@ class ReceiveOneTest(testlib.TestCase):
         self.assertEqual(1, stream.on_disconnect.call_count)
         expect = self.klass.corrupt_msg % (stream.name, junk)
         self.assertIn(expect, capture.raw())
+
+
+class ReceiveManyTest(testlib.TestCase):
+    klass = mitogen.core.MitogenProtocol
+
+    def make_protocol(self):
+        router = mock.Mock()
+        router.max_message_size = 1048576
+        protocol = self.klass(router, 1)
+        protocol.stream = mock.Mock()
+        return protocol
+
+    def received(self, protocol):
+        return [args[0].data
+                for args, _ in protocol._router._async_route.call_args_list]
+
+    def test_many_per_read(self):
+        protocol = self.make_protocol()
+        datas = [mitogen.core.b(str(i)) * i for i in range(50)]
+        packed = mitogen.core.b('').join(
+            mitogen.core.Message(dst_id=1, handle=2, data=data).pack()
+            for data in datas
+        )
+        protocol.on_receive(mock.Mock(), packed)
+        self.assertEqual(datas, self.received(protocol))
+        self.assertEqual(0, protocol._input_buf_len)
+
+    def test_split_reads(self):
+        protocol = self.make_protocol()
+        datas = [mitogen.core.b('x') * 1000, mitogen.core.b(''),
+                 mitogen.core.b('y') * 7000]
+        packed = mitogen.core.b('').join(
+            mitogen.core.Message(dst_id=1, handle=2, data=data).pack()
+            for data in datas
+        )
+        for size in 1, 7, 4096:
+            protocol._router.reset_mock()
+            for i in range(0, len(packed), size):
+                protocol.on_receive(mock.Mock(), packed[i:i + size])
+            self.assertEqual(datas, self.received(protocol))
+            self.assertEqual(0, protocol._input_buf_len)
@@ -57,6 +57,20 @@ class GetDefaultRemoteNameTest(testlib.TestCase):
         self.assertEqual("ECORP_Administrator@box:123", self.func())
 
 
+class ArgvTest(testlib.TestCase):
+    klass = mitogen.parent.Argv
+
+    def test_plain(self):
+        self.assertEqual('ls -l', str(self.klass(['ls', '-l'])))
+
+    def test_space(self):
+        self.assertEqual('echo "a b"', str(self.klass(['echo', 'a b'])))
+
+    def test_metachars(self):
+        self.assertEqual('"\\\\\\$\\"\\`\\!x\'"',
+                         str(self.klass(['\\$"`!x\''])))
+
+
 class ReturncodeToStrTest(testlib.TestCase):
     func = staticmethod(mitogen.parent.returncode_to_str)
 
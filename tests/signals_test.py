@@ -36,3 +36,8 @@ class ListenFireTest(testlib.TestCase):
         self.assertEqual('event fired', latch2.get())
         self.assertTrue(latch.empty())
         self.assertTrue(latch2.empty())
+
+    def test_no_listeners(self):
+        thing = Thing()
+        mitogen.core.fire(thing, 'event', 'event fired')
+        self.assertEqual({}, vars(thing))